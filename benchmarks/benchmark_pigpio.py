@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark script for DHT11 sensor reads using the pigpio daemon.
+Same CSV format and statistics as the C and Adafruit benchmarks.
+
+pigpio timestamps GPIO edges with its DMA sampler, so the 40-bit frame
+is decoded from daemon-reported tick deltas instead of userspace
+bit-banging - scheduler preemption no longer corrupts the timing, which
+should show up as fewer retries than the Adafruit benchmark.
+
+Requires the pigpio daemon: sudo pigpiod
+Usage: python3 benchmark_pigpio.py [count]
+"""
+
+import sys
+import threading
+import time
+import pigpio
+
+# Retry delays in seconds: 0.1s x3, then 0.2, 0.4, 0.8, 1.6, 2s x3
+RETRY_DELAYS = [0.1, 0.1, 0.1, 0.2, 0.4, 0.8, 1.6, 2.0, 2.0, 2.0]
+
+# GPIO pin and protocol constants
+GPIO_PIN = 4
+START_LOW_S = 0.018         # Start signal: hold line low for 18ms
+READ_TIMEOUT_S = 0.2        # Max wait for the full edge train
+BIT_THRESHOLD_US = 50       # High pulse: ~26-28us = 0, ~70us = 1
+
+
+class DHT11Pigpio:
+    """DHT11 reader backed by pigpio's DMA-timestamped edge callbacks."""
+
+    def __init__(self, pi, gpio):
+        self.pi = pi
+        self.gpio = gpio
+        self._edges = []
+        self._done = threading.Event()
+        self._cb = pi.callback(gpio, pigpio.EITHER_EDGE, self._edge)
+
+    def _edge(self, gpio, level, tick):
+        self._edges.append((level, tick))
+        # Response preamble + 40 data bits is ~83 edges
+        if len(self._edges) >= 83:
+            self._done.set()
+
+    def read(self):
+        """Trigger one exchange and return (temperature, humidity).
+
+        Raises RuntimeError on a short read or checksum mismatch.
+        """
+        self._edges = []
+        self._done.clear()
+
+        # Start signal: pull low, then release with pull-up and let the
+        # daemon timestamp the sensor's reply
+        self.pi.set_mode(self.gpio, pigpio.OUTPUT)
+        self.pi.write(self.gpio, 0)
+        time.sleep(START_LOW_S)
+        self.pi.set_mode(self.gpio, pigpio.INPUT)
+        self.pi.set_pull_up_down(self.gpio, pigpio.PUD_UP)
+
+        self._done.wait(READ_TIMEOUT_S)
+        return self._decode()
+
+    def _decode(self):
+        # High pulse widths from consecutive rising/falling edge pairs
+        highs = []
+        rise = None
+        for level, tick in list(self._edges):
+            if level == 1:
+                rise = tick
+            elif level == 0 and rise is not None:
+                highs.append(pigpio.tickDiff(rise, tick))
+                rise = None
+
+        # Data bits are the last 40 highs; anything before is the
+        # response preamble and start-signal release
+        if len(highs) < 40:
+            raise RuntimeError(f"Short read: {len(highs)} pulses")
+        bits = [1 if us > BIT_THRESHOLD_US else 0 for us in highs[-40:]]
+
+        data = []
+        for i in range(0, 40, 8):
+            byte = 0
+            for bit in bits[i:i + 8]:
+                byte = (byte << 1) | bit
+            data.append(byte)
+
+        if (data[0] + data[1] + data[2] + data[3]) & 0xFF != data[4]:
+            raise RuntimeError("Checksum mismatch")
+
+        temperature = float(data[2]) + float(data[3]) / 10.0
+        humidity = float(data[0]) + float(data[1]) / 10.0
+        return temperature, humidity
+
+    def close(self):
+        self._cb.cancel()
+
+
+# Default count
+count = 500
+if len(sys.argv) >= 2:
+    count = int(sys.argv[1])
+    if count <= 0:
+        print(f"Usage: {sys.argv[0]} [count]", file=sys.stderr)
+        sys.exit(1)
+
+pi = pigpio.pi()
+if not pi.connected:
+    print("Cannot connect to pigpiod - start it with: sudo pigpiod", file=sys.stderr)
+    sys.exit(1)
+
+sensor = DHT11Pigpio(pi, GPIO_PIN)
+
+times = []
+successes = 0
+failures = 0
+total_attempts = 0
+
+print(f"Running {count} DHT11 reads on GPIO {GPIO_PIN} via pigpiod...", file=sys.stderr)
+
+# Open output file
+with open("results_pigpio.csv", "w") as f:
+    f.write("read,time,attempts\n")
+
+    for i in range(count):
+        start = time.perf_counter_ns()
+        temp = None
+        humidity = None
+        attempts = 0
+
+        # Retry loop like C version
+        for attempt, delay in enumerate([0] + RETRY_DELAYS):
+            if attempt > 0:
+                time.sleep(delay)
+
+            attempts = attempt + 1
+
+            try:
+                temp, humidity = sensor.read()
+                break  # Success
+            except RuntimeError:
+                pass  # Retry
+
+        elapsed_ns = time.perf_counter_ns() - start
+        times.append(elapsed_ns)
+
+        if temp is not None:
+            successes += 1
+            total_attempts += attempts
+            f.write(f"{i+1},{elapsed_ns/1e9:.6f},{attempts}\n")
+        else:
+            failures += 1
+            f.write(f"{i+1},{elapsed_ns/1e9:.6f},-1\n")
+
+        # Progress indicator every 50 reads
+        if (i + 1) % 50 == 0:
+            print(f"  Progress: {i+1}/{count}", file=sys.stderr)
+
+        # Short delay between readings (same as C benchmark)
+        if i < count - 1:
+            time.sleep(0.1)
+
+sensor.close()
+pi.stop()
+
+# Calculate statistics in integer ns, convert to seconds once for printing
+avg_time = sum(times) / len(times) / 1e9
+min_time = min(times) / 1e9
+max_time = max(times) / 1e9
+total_time = sum(times) / 1e9
+
+# Print summary to stdout
+print(f"\n=== pigpio Statistics ===")
+print(f"Readings:     {successes} success, {failures} failed ({successes/count*100:.1f}% success rate)")
+if successes > 0:
+    print(f"Avg attempts: {total_attempts/successes:.2f} per successful read")
+print(f"Timing:       min={min_time:.4f}s, max={max_time:.4f}s, avg={avg_time:.4f}s, total={total_time:.4f}s")
+print(f"Results saved to results_pigpio.csv")
@@ -64,7 +64,7 @@ PIP_CMD="$TEMP_VENV/bin/pip3"
 
 # Install required packages
 echo "Installing required Python packages..."
-"$PIP_CMD" install --quiet RPi.GPIO adafruit-circuitpython-dht adafruit-blinka
+"$PIP_CMD" install --quiet RPi.GPIO adafruit-circuitpython-dht adafruit-blinka numpy
 
 # Run Python with sudo
 if [ "$EUID" -eq 0 ]; then
@@ -19,6 +19,7 @@
 #include <stdbool.h>
 #include <signal.h>
 #include <syslog.h>
+#include <pthread.h>
 #include <gpiod.h>
 
 #include "dht11.h"
@@ -437,24 +438,29 @@ int read_dht11(int gpio_pin, sensor_reading_t *reading) {
 
 /*
  * Get Raspberry Pi serial number with _dht11 suffix.
+ * The raw serial is read from /proc/cpuinfo once and cached for the
+ * lifetime of the process, so configs listing several sensors without
+ * a sensor_id don't re-scan the file per entry.
  * Returns dynamically allocated string, caller must free.
  */
 static char *get_serial_number(void) {
-    char *raw_serial = ws_get_serial_number();
-    if (!raw_serial) {
-        return NULL;
+    static char *cached_serial = NULL;
+
+    if (!cached_serial) {
+        cached_serial = ws_get_serial_number();
+        if (!cached_serial) {
+            return NULL;
+        }
     }
-    
+
     /* Allocate space for raw serial + "_dht11" + null */
-    size_t len = strlen(raw_serial) + 7;
+    size_t len = strlen(cached_serial) + 7;
     char *result = malloc(len);
     if (!result) {
-        free(raw_serial);
         return NULL;
     }
-    
-    snprintf(result, len, "%s_dht11", raw_serial);
-    free(raw_serial);
+
+    snprintf(result, len, "%s_dht11", cached_serial);
     return result;
 }
 
@@ -756,11 +762,109 @@ static void build_sensor_json(char *output, size_t output_len,
     }
 }
 
+/*
+ * Append a sensor JSON fragment to the output array buffer.
+ * Tracks the accumulated length so each append costs O(fragment)
+ * instead of re-scanning the whole output with strcat.
+ * Grows the buffer as needed; returns 0 on success, -1 on allocation failure.
+ */
+static int append_sensor_json(char **output, size_t *output_size, size_t *output_len,
+                              const char *fragment, int *first) {
+    size_t frag_len = strlen(fragment);
+    size_t needed = *output_len + frag_len + 3;  /* comma + "]" + null */
+
+    if (needed > *output_size) {
+        size_t new_size = needed * 2;
+        char *new_output = realloc(*output, new_size);
+        if (!new_output) {
+            return -1;
+        }
+        *output = new_output;
+        *output_size = new_size;
+    }
+
+    if (!*first) {
+        (*output)[(*output_len)++] = ',';
+    }
+    memcpy(*output + *output_len, fragment, frag_len + 1);
+    *output_len += frag_len;
+    *first = 0;
+    return 0;
+}
+
+/* Per-sensor read state so multiple sensors can be read concurrently */
+typedef struct {
+    sensor_config_t *config;
+    sensor_reading_t reading;
+    time_t timestamp;
+    int result;
+} read_task_t;
+
+/*
+ * Thread entry point for a single sensor read
+ */
+static void *read_task_thread(void *arg) {
+    read_task_t *task = (read_task_t *)arg;
+    task->timestamp = time(NULL);
+    task->result = read_dht11(task->config->pin, &task->reading);
+    return NULL;
+}
+
+/*
+ * Run the queued sensor reads, in parallel when there is more than one
+ * sensor and each sits on its own pin. The DHT11 exchange is per-pin,
+ * so sensors on distinct GPIO lines don't interfere and wall time
+ * becomes the slowest read instead of the sum of all reads (each read
+ * can take seconds with retries). Falls back to sequential reads when
+ * entries share a pin or threads cannot be created. While reads run
+ * concurrently the signal-handler GPIO cleanup globals are best-effort.
+ */
+static void run_read_tasks(read_task_t *tasks, int task_count) {
+    int i, j;
+    bool pins_distinct = true;
+
+    for (i = 0; i < task_count && pins_distinct; i++) {
+        for (j = i + 1; j < task_count; j++) {
+            if (tasks[i].config->pin == tasks[j].config->pin) {
+                pins_distinct = false;
+                break;
+            }
+        }
+    }
+
+    if (task_count > 1 && pins_distinct) {
+        pthread_t *threads = malloc(task_count * sizeof(pthread_t));
+        if (threads) {
+            int started = 0;
+            for (i = 0; i < task_count; i++) {
+                if (pthread_create(&threads[i], NULL, read_task_thread, &tasks[i]) != 0) {
+                    break;
+                }
+                started++;
+            }
+            for (i = 0; i < started; i++) {
+                pthread_join(threads[i], NULL);
+            }
+            /* Any tasks whose thread failed to start run sequentially */
+            for (i = started; i < task_count; i++) {
+                read_task_thread(&tasks[i]);
+            }
+            free(threads);
+            return;
+        }
+    }
+
+    for (i = 0; i < task_count; i++) {
+        read_task_thread(&tasks[i]);
+    }
+}
+
 /*
  * Output sensor reading as JSON
  */
 void output_json(sensor_config_t *configs, int count, const char *filter, ws_location_filter_t location_filter) {
     size_t output_size = 4096;  /* Initial size, will grow if needed */
+    size_t output_len = 1;
     char *output = malloc(output_size);
     if (!output) {
         fprintf(stderr, "Memory allocation failed\n");
@@ -769,38 +873,50 @@ void output_json(sensor_config_t *configs, int count, const char *filter, ws_loc
     strcpy(output, "[");
     int first = 1;
     int i;
-    
+    int task_count = 0;
+
+    read_task_t *tasks = malloc(count * sizeof(read_task_t));
+    if (!tasks) {
+        free(output);
+        fprintf(stderr, "Memory allocation failed\n");
+        return;
+    }
+
+    /* Queue sensors that match the location filter */
     for (i = 0; i < count; i++) {
-        sensor_reading_t reading;
-        size_t id_len = configs[i].sensor_id ? strlen(configs[i].sensor_id) : 0;
+        if (location_filter == WS_LOCATION_INTERNAL && !configs[i].internal) {
+            continue;
+        }
+        if (location_filter == WS_LOCATION_EXTERNAL && configs[i].internal) {
+            continue;
+        }
+        tasks[task_count].config = &configs[i];
+        tasks[task_count].result = -1;
+        task_count++;
+    }
+
+    run_read_tasks(tasks, task_count);
+
+    for (i = 0; i < task_count; i++) {
+        sensor_config_t *config = tasks[i].config;
+        sensor_reading_t *reading = &tasks[i].reading;
+        time_t read_timestamp = tasks[i].timestamp;
+        size_t id_len = config->sensor_id ? strlen(config->sensor_id) : 0;
         char *escaped_id = malloc(id_len * 2 + 1);
         if (!escaped_id) {
+            free(tasks);
             free(output);
             fprintf(stderr, "Memory allocation failed\n");
             return;
         }
         const char *error_msg = NULL;
-        time_t read_timestamp;
-        
-        /* Skip sensors that don't match the location filter */
-        if (location_filter == WS_LOCATION_INTERNAL && !configs[i].internal) {
-            free(escaped_id);
-            continue;
-        }
-        if (location_filter == WS_LOCATION_EXTERNAL && configs[i].internal) {
-            free(escaped_id);
-            continue;
-        }
-        
-        ws_json_escape_string(configs[i].sensor_id, escaped_id, id_len * 2 + 1);
-        
-        /* Capture timestamp when sensor is read */
-        read_timestamp = time(NULL);
-        
-        if (read_dht11(configs[i].pin, &reading) != 0 || !reading.valid) {
-            error_msg = reading.error_msg;
+
+        ws_json_escape_string(config->sensor_id, escaped_id, id_len * 2 + 1);
+
+        if (tasks[i].result != 0 || !reading->valid) {
+            error_msg = reading->error_msg;
         }
-        
+
         if (!filter || strcmp(filter, "temperature") == 0 || strcmp(filter, "all") == 0) {
             char temp_json[1024];
             char *sensor_id_temp = malloc(id_len * 2 + 16);
@@ -809,20 +925,12 @@ void output_json(sensor_config_t *configs, int count, const char *filter, ws_loc
                 
                 build_sensor_json(temp_json, sizeof(temp_json),
                                   "dht11_temperature", "temperature", "Celsius",
-                                  reading.temperature, configs[i].internal, sensor_id_temp,
-                                  configs[i].sensor_name, error_msg, read_timestamp);
-                
-                /* Grow output buffer if needed */
-                size_t needed = strlen(output) + strlen(temp_json) + 3;
-                if (needed > output_size) {
-                    output_size = needed * 2;
-                    char *new_output = realloc(output, output_size);
-                    if (new_output) output = new_output;
+                                  reading->temperature, config->internal, sensor_id_temp,
+                                  config->sensor_name, error_msg, read_timestamp);
+
+                if (append_sensor_json(&output, &output_size, &output_len, temp_json, &first) < 0) {
+                    fprintf(stderr, "Memory allocation failed\n");
                 }
-                
-                if (!first) strcat(output, ",");
-                strcat(output, temp_json);
-                first = 0;
                 free(sensor_id_temp);
             }
         }
@@ -835,28 +943,22 @@ void output_json(sensor_config_t *configs, int count, const char *filter, ws_loc
                 
                 build_sensor_json(humid_json, sizeof(humid_json),
                                   "dht11_humidity", "humidity", "percentage",
-                                  reading.humidity, configs[i].internal, sensor_id_humid,
-                                  configs[i].sensor_name, error_msg, read_timestamp);
-                
-                /* Grow output buffer if needed */
-                size_t needed = strlen(output) + strlen(humid_json) + 3;
-                if (needed > output_size) {
-                    output_size = needed * 2;
-                    char *new_output = realloc(output, output_size);
-                    if (new_output) output = new_output;
+                                  reading->humidity, config->internal, sensor_id_humid,
+                                  config->sensor_name, error_msg, read_timestamp);
+
+                if (append_sensor_json(&output, &output_size, &output_len, humid_json, &first) < 0) {
+                    fprintf(stderr, "Memory allocation failed\n");
                 }
-                
-                if (!first) strcat(output, ",");
-                strcat(output, humid_json);
-                first = 0;
                 free(sensor_id_humid);
             }
         }
         
         free(escaped_id);
     }
-    
-    strcat(output, "]");
+    free(tasks);
+
+    output[output_len++] = ']';
+    output[output_len] = '\0';
     printf("%s\n", output);
     free(output);
 }